@@ -0,0 +1,113 @@
+"""
+Compiled payroll kernels for batch processing.
+
+The kernels operate on NumPy columns (one entry per employee) and write
+gross salary, deductions and net salary into preallocated output arrays
+in a single fused pass, so ``Payroll.process_batch`` reads each
+employee's inputs once and allocates no intermediate arrays.
+
+If the ``payroll_kernels`` extension built by build_kernels.py is
+importable, its ahead-of-time compiled kernels are exported instead of the
+JIT ones. Numba is optional: without it (and without the AOT module) the
+kernels are plain Python functions and ``HAS_COMPILED_KERNELS`` is False,
+in which case callers should prefer their NumPy implementation.
+
+Importing this module imports Numba, so employee.py loads it lazily on
+the first batch. The JIT kernels are cached on disk (``cache=True``), so
+only the first process after a change pays the compilation cost.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+from _payroll_tables import (
+    FULLTIME_BRACKETS,
+    FULLTIME_RATES,
+    FULLTIME_TUNJANGAN_DIVISORS,
+    TUNJANGAN_DIVISORS,
+)
+
+# All fast-math flags except nnan/ninf: the allowance divisor tables use
+# math.inf, which must still divide to zero
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def fulltime_kernel(base, wh, tunj, per_code, out_gross, out_ded, out_net):
+    """
+    Compute gross salary and deductions for fulltime employees.
+
+    Args:
+        base (np.ndarray): Base salary, float64
+        wh (np.ndarray): Work hours, float64
+        tunj (np.ndarray): Allowance amount, float64
+        per_code (np.ndarray): Allowance period code, int8
+        out_gross (np.ndarray): Output gross salary, float64
+        out_ded (np.ndarray): Output total deductions, float64
+        out_net (np.ndarray): Output net salary, float64
+    """
+    for i in prange(base.shape[0]):
+        overtime_pay = max(0.0, wh[i] - 173.0) * (base[i] / 173.0) * 1.5
+
+        monthly_tunjangan = tunj[i] / FULLTIME_TUNJANGAN_DIVISORS[per_code[i]]
+
+        gross = base[i] + overtime_pay + monthly_tunjangan
+
+        # Bracket index = number of bounds exceeded (branchless lookup)
+        annual = gross * 12.0
+        bracket = (
+            int(annual > FULLTIME_BRACKETS[0])
+            + int(annual > FULLTIME_BRACKETS[1])
+            + int(annual > FULLTIME_BRACKETS[2])
+        )
+        rate = FULLTIME_RATES[bracket]
+
+        # BPJS Kesehatan (1%) + BPJS Ketenagakerjaan (2%)
+        deduction = annual * rate / 12.0 + gross * 0.03
+
+        out_gross[i] = gross
+        out_ded[i] = deduction
+        out_net[i] = gross - deduction
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def contract_kernel(wh, rate, tunj, per_code, out_gross, out_ded, out_net):
+    """
+    Compute gross salary and deductions for contract employees.
+
+    Args:
+        wh (np.ndarray): Work hours, float64
+        rate (np.ndarray): Hourly rate, float64
+        tunj (np.ndarray): Allowance amount, float64
+        per_code (np.ndarray): Allowance period code, int8
+        out_gross (np.ndarray): Output gross salary, float64
+        out_ded (np.ndarray): Output total deductions, float64
+        out_net (np.ndarray): Output net salary, float64
+    """
+    for i in prange(wh.shape[0]):
+        monthly_tunjangan = tunj[i] / TUNJANGAN_DIVISORS[per_code[i]]
+
+        gross = wh[i] * rate[i] + monthly_tunjangan
+
+        deduction = gross * 0.025
+
+        out_gross[i] = gross
+        out_ded[i] = deduction
+        out_net[i] = gross - deduction
+
+
+# Prefer ahead-of-time compiled kernels (no JIT warmup) when they were built
+try:
+    from payroll_kernels import contract_kernel, fulltime_kernel
+    HAS_COMPILED_KERNELS = True
+except ImportError:
+    HAS_COMPILED_KERNELS = HAS_NUMBA
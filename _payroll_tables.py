@@ -0,0 +1,25 @@
+"""
+Payroll constants shared by employee.py and the batch kernels.
+
+Kept free of NumPy/Numba imports so that importing employee.py stays
+cheap; the compiled kernels in _payroll_kernels.py are only loaded on
+the first batch run.
+"""
+
+import math
+
+# Integer codes for ``periode_tunjangan``; employee.Periode is built from these
+PERIODE_MONTHLY = 0
+PERIODE_YEARLY = 1
+PERIODE_PER_PROJECT = 2
+PERIODE_NONE = 3
+
+# Divisor turning an allowance into its monthly amount, indexed by period
+# code; math.inf means the period contributes no allowance
+TUNJANGAN_DIVISORS = (1.0, 12.0, 1.0, math.inf)
+# Per-project allowances do not apply to fulltime employees
+FULLTIME_TUNJANGAN_DIVISORS = (1.0, 12.0, math.inf, math.inf)
+
+# Fulltime tax brackets: inclusive annual upper bounds and the rate of each
+FULLTIME_BRACKETS = (54000000.0, 250000000.0, 500000000.0)
+FULLTIME_RATES = (0.05, 0.15, 0.25, 0.30)
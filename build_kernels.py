@@ -0,0 +1,36 @@
+"""
+Ahead-of-time compile the batch payroll kernels.
+
+Running this script builds the ``payroll_kernels`` extension module next to
+it, using the kernel definitions in _payroll_kernels.py. When that module
+is importable, ``Payroll.process_batch`` uses it instead of JIT-compiling
+the kernels, so short-running payroll scripts skip the Numba warmup.
+The AOT kernels run single-threaded; remove the built module to go back
+to the parallel JIT kernels.
+
+Requires Numba (and a C compiler) at build time only:
+
+    python build_kernels.py
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+# Make sure we compile from the Python sources, not a previously built module
+sys.modules['payroll_kernels'] = None
+import _payroll_kernels
+
+cc = CC('payroll_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# base/wh/tunj (or wh/rate/tunj), period codes, then gross/deduction/net outputs
+_SIGNATURE = 'void(f8[:], f8[:], f8[:], i1[:], f8[:], f8[:], f8[:])'
+
+cc.export('fulltime_kernel', _SIGNATURE)(_payroll_kernels.fulltime_kernel.py_func)
+cc.export('contract_kernel', _SIGNATURE)(_payroll_kernels.contract_kernel.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -5,6 +5,7 @@ This module provides a comprehensive employee management system that supports
 different types of employees with flexible tax calculation strategies.
 
 Classes:
+    Periode: Allowance period of an employee
     Tax: Abstract base class for tax calculation strategies
     Employee: Abstract base class for all employee types
     FulltimeTax: Tax calculation implementation for fulltime employees
@@ -22,10 +23,62 @@ Example:
     >>> PayrollPresentation.print_payroll_summary(payroll_data)
 """
 
+import math
+import sys
 from abc import ABC, abstractmethod
-from typing import Union, List
+from bisect import bisect_left
+from enum import IntEnum
+from collections import defaultdict
+from typing import Union, Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch processing falls back to the scalar path
+    np = None
+
+from _payroll_tables import (
+    FULLTIME_BRACKETS,
+    FULLTIME_RATES,
+    FULLTIME_TUNJANGAN_DIVISORS,
+    PERIODE_MONTHLY,
+    PERIODE_NONE,
+    PERIODE_PER_PROJECT,
+    PERIODE_YEARLY,
+    TUNJANGAN_DIVISORS,
+)
+
+# Batch kernels module; imported on first use since it pulls in Numba
+_kernels = None
+
+
+def _load_kernels():
+    global _kernels
+    if _kernels is None:
+        import _payroll_kernels
+        _kernels = _payroll_kernels
+    return _kernels
+
+
+class Periode(IntEnum):
+    """
+    Allowance period of an employee.
+
+    Values are the integer codes from _payroll_tables.py, so they can be
+    stored in NumPy columns and read by the batch kernels.
+    """
+    MONTHLY = PERIODE_MONTHLY
+    YEARLY = PERIODE_YEARLY
+    PER_PROJECT = PERIODE_PER_PROJECT
+    NONE = PERIODE_NONE
+
+
+_PERIODE_MAP = {
+    "monthly": Periode.MONTHLY,
+    "yearly": Periode.YEARLY,
+    "per_project": Periode.PER_PROJECT,
+}
+
 
 class Tax(ABC):
     """
@@ -60,10 +113,21 @@ class Employee(ABC):
         employee_id (str): Unique identifier for the employee
         work_hour (float): Number of work hours
         tunjangan (float): Allowance amount
-        periode_tunjangan (str): Period of allowance (monthly, yearly, per_project)
+        periode_tunjangan (Periode): Period of allowance (monthly, yearly, per_project)
+        EMPLOYEE_TYPE_LABEL (str): Class-level label shown in payroll reports;
+            defaults to the class name
     """
+
+    __slots__ = ('employee_id', 'work_hour', 'tunjangan', 'periode_tunjangan')
+    # Allowance divisors indexed by Periode code (see _payroll_tables.py)
+    _TUNJANGAN_DIVISORS = TUNJANGAN_DIVISORS
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'EMPLOYEE_TYPE_LABEL' not in cls.__dict__:
+            cls.EMPLOYEE_TYPE_LABEL = cls.__name__
     
-    def __init__(self, employee_id: str, work_hour: float, tunjangan: float, periode_tunjangan: str):
+    def __init__(self, employee_id: str, work_hour: float, tunjangan: float, periode_tunjangan: Union[str, Periode]):
         """
         Initialize Employee with basic information.
         
@@ -71,12 +135,16 @@ class Employee(ABC):
             employee_id (str): Unique identifier for the employee
             work_hour (float): Number of work hours
             tunjangan (float): Allowance amount
-            periode_tunjangan (str): Period of allowance
+            periode_tunjangan (Union[str, Periode]): Period of allowance; unknown
+                strings map to ``Periode.NONE``
         """
         self.employee_id = employee_id
         self.work_hour = work_hour
         self.tunjangan = tunjangan
-        self.periode_tunjangan = periode_tunjangan
+        if isinstance(periode_tunjangan, Periode):
+            self.periode_tunjangan = periode_tunjangan
+        else:
+            self.periode_tunjangan = _PERIODE_MAP.get(periode_tunjangan, Periode.NONE)
     
     @abstractmethod
     def calculate_gross(self) -> float:
@@ -108,20 +176,63 @@ class Employee(ABC):
         """
         pass
 
+    def _calculate_deduction_from_gross(self, gross: float) -> float:
+        """
+        Calculate total deductions from an already computed gross salary.
+
+        Subclasses override this to avoid recomputing the gross salary;
+        the default simply defers to ``calculate_deduction``.
+
+        Args:
+            gross (float): The gross salary as returned by ``calculate_gross``
+
+        Returns:
+            float: The calculated total deductions
+        """
+        return self.calculate_deduction()
+
+    def _monthly_tunjangan(self) -> float:
+        """Return the allowance converted to a monthly amount."""
+        return self.tunjangan / self._TUNJANGAN_DIVISORS[self.periode_tunjangan]
+
 class FulltimeTax(Tax):
+    # Upper bound (inclusive) of each bracket and the rate applied within it
+    _BRACKETS = FULLTIME_BRACKETS
+    _BRACKET_RATES = FULLTIME_RATES
+    if np is not None:
+        _THRESHOLDS = np.array(_BRACKETS)
+        _RATES = np.array(_BRACKET_RATES)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Rebuild the vector tables so calculate_tax_vec follows overridden brackets
+        if np is not None:
+            cls._THRESHOLDS = np.array(cls._BRACKETS)
+            cls._RATES = np.array(cls._BRACKET_RATES)
+
     def calculate_tax(self, gross_salary: float) -> float:
-        if gross_salary <= 54000000:
-            return gross_salary * 0.05
-        elif gross_salary <= 250000000:
-            return gross_salary * 0.15
-        elif gross_salary <= 500000000:
-            return gross_salary * 0.25
-        else:
-            return gross_salary * 0.30
+        return gross_salary * self._BRACKET_RATES[bisect_left(self._BRACKETS, gross_salary)]
+
+    def calculate_tax_vec(self, gross_array):
+        """
+        Vectorized ``calculate_tax`` over a NumPy array of gross salaries.
+
+        Args:
+            gross_array (np.ndarray): Gross salary amounts
+
+        Returns:
+            np.ndarray: The calculated tax amounts
+        """
+        # side='left' keeps the bounds inclusive, matching bisect_left above
+        return gross_array * self._RATES[np.searchsorted(self._THRESHOLDS, gross_array, side='left')]
 
 
 class FulltimeEmployee(Employee):
-    def __init__(self, employee_id: str, work_hour: float, tunjangan: float, periode_tunjangan: str, base_salary: float, tax_calculator: Tax):
+    __slots__ = ('base_salary', 'tax_calculator')
+    EMPLOYEE_TYPE_LABEL = "FulltimeEmployee"
+    _TUNJANGAN_DIVISORS = FULLTIME_TUNJANGAN_DIVISORS
+
+    def __init__(self, employee_id: str, work_hour: float, tunjangan: float, periode_tunjangan: Union[str, Periode], base_salary: float, tax_calculator: Tax):
         super().__init__(employee_id, work_hour, tunjangan, periode_tunjangan)
         self.base_salary = base_salary
         self.tax_calculator = tax_calculator
@@ -131,25 +242,19 @@ class FulltimeEmployee(Employee):
         overtime_rate = self.base_salary / 173
         overtime_hours = max(0, self.work_hour - 173)
         overtime_pay = overtime_hours * overtime_rate * 1.5
-        
-        if self.periode_tunjangan == "monthly":
-            monthly_tunjangan = self.tunjangan
-        elif self.periode_tunjangan == "yearly":
-            monthly_tunjangan = self.tunjangan / 12
-        else:
-            monthly_tunjangan = 0
-            
-        return monthly_salary + overtime_pay + monthly_tunjangan
+        return monthly_salary + overtime_pay + self._monthly_tunjangan()
     
     def calculate_deduction(self) -> float:
-        gross = self.calculate_gross()
+        return self._calculate_deduction_from_gross(self.calculate_gross())
+
+    def _calculate_deduction_from_gross(self, gross: float) -> float:
         tax = self.tax_calculator.calculate_tax(gross * 12) / 12
-        bpjs_kesehatan = gross * 0.01
-        bpjs_ketenagakerjaan = gross * 0.02
-        return tax + bpjs_kesehatan + bpjs_ketenagakerjaan
+        # BPJS Kesehatan (1%) + BPJS Ketenagakerjaan (2%)
+        return tax + gross * 0.03
     
     def calculate_net(self) -> float:
-        return self.calculate_gross() - self.calculate_deduction()
+        gross = self.calculate_gross()
+        return gross - self._calculate_deduction_from_gross(gross)
 
 
 class ContractTax(Tax):
@@ -158,47 +263,66 @@ class ContractTax(Tax):
 
 
 class ContractEmployee(Employee):
-    def __init__(self, employee_id: str, work_hour: float, tunjangan: float, periode_tunjangan: str, hourly_rate: float, tax_calculator: Tax):
+    __slots__ = ('hourly_rate', 'tax_calculator')
+    EMPLOYEE_TYPE_LABEL = "ContractEmployee"
+
+    def __init__(self, employee_id: str, work_hour: float, tunjangan: float, periode_tunjangan: Union[str, Periode], hourly_rate: float, tax_calculator: Tax):
         super().__init__(employee_id, work_hour, tunjangan, periode_tunjangan)
         self.hourly_rate = hourly_rate
         self.tax_calculator = tax_calculator
     
     def calculate_gross(self) -> float:
         base_pay = self.work_hour * self.hourly_rate
-        
-        if self.periode_tunjangan == "monthly":
-            monthly_tunjangan = self.tunjangan
-        elif self.periode_tunjangan == "yearly":
-            monthly_tunjangan = self.tunjangan / 12
-        elif self.periode_tunjangan == "per_project":
-            monthly_tunjangan = self.tunjangan
-        else:
-            monthly_tunjangan = 0
-            
-        return base_pay + monthly_tunjangan
+        return base_pay + self._monthly_tunjangan()
     
     def calculate_deduction(self) -> float:
-        gross = self.calculate_gross()
+        return self._calculate_deduction_from_gross(self.calculate_gross())
+
+    def _calculate_deduction_from_gross(self, gross: float) -> float:
         tax = self.tax_calculator.calculate_tax(gross)
         return tax
     
     def calculate_net(self) -> float:
-        return self.calculate_gross() - self.calculate_deduction()
+        gross = self.calculate_gross()
+        return gross - self._calculate_deduction_from_gross(gross)
 
 
 class PayrollData:
+    __slots__ = ('employee', 'pay_period', 'processed_date', 'gross_salary', 'deductions', 'net_salary')
+
     def __init__(self, employee: Employee, pay_period: str, processed_date: datetime):
         self.employee = employee
         self.pay_period = pay_period
         self.processed_date = processed_date
         self.gross_salary = employee.calculate_gross()
-        self.deductions = employee.calculate_deduction()
-        self.net_salary = employee.calculate_net()
+        self.deductions = employee._calculate_deduction_from_gross(self.gross_salary)
+        self.net_salary = self.gross_salary - self.deductions
+
+    @classmethod
+    def _from_values(cls, employee: Employee, pay_period: str, processed_date: datetime,
+                     gross_salary: float, deductions: float, net_salary: float) -> "PayrollData":
+        """Build a record from precomputed amounts without recalculating them."""
+        payroll_data = cls.__new__(cls)
+        payroll_data.employee = employee
+        payroll_data.pay_period = pay_period
+        payroll_data.processed_date = processed_date
+        payroll_data.gross_salary = gross_salary
+        payroll_data.deductions = deductions
+        payroll_data.net_salary = net_salary
+        return payroll_data
 
 
 class Payroll:
     def __init__(self):
-        self.payroll_records: List[PayrollData] = []
+        # Only modified through _record so the index and totals below stay in sync
+        self._records: List[PayrollData] = []
+        self._by_emp: Dict[str, List[PayrollData]] = defaultdict(list)
+        # Running totals of records from process_payroll, plus the gross/net
+        # columns retained from each process_batch call
+        self._scalar_gross = 0.0
+        self._scalar_net = 0.0
+        self._batch_gross = []
+        self._batch_net = []
     
     def process_payroll(self, employee: Employee, pay_period: str) -> PayrollData:
         payroll_data = PayrollData(
@@ -206,47 +330,233 @@ class Payroll:
             pay_period=pay_period,
             processed_date=datetime.now()
         )
-        self.payroll_records.append(payroll_data)
+        self._record([payroll_data])
         return payroll_data
+
+    def _record(self, batch: List[PayrollData], gross=None, net=None) -> None:
+        """
+        Store new records, index them by employee id and update the totals.
+
+        Args:
+            batch (List[PayrollData]): Records to store
+            gross: NumPy gross salary column for ``batch``, if computed as one
+            net: NumPy net salary column for ``batch``, if computed as one
+        """
+        self._records.extend(batch)
+        for payroll_data in batch:
+            self._by_emp[payroll_data.employee.employee_id].append(payroll_data)
+        if gross is None:
+            for payroll_data in batch:
+                self._scalar_gross += payroll_data.gross_salary
+                self._scalar_net += payroll_data.net_salary
+        else:
+            self._batch_gross.append(gross)
+            self._batch_net.append(net)
+
+    def process_batch(self, employees: List[Employee], pay_period: str) -> List[PayrollData]:
+        """
+        Process payroll for many employees in a single vectorized pass.
+
+        Fulltime and contract employees using the standard tax strategies are
+        laid out as NumPy columns and computed together. Any other employee
+        type (or tax strategy) goes through the regular per-employee path,
+        as does the whole batch when NumPy is not installed. All records
+        share a single processed date.
+
+        Args:
+            employees (List[Employee]): Employees to process
+            pay_period (str): Pay period shared by all records
+
+        Returns:
+            List[PayrollData]: The created records, in input order
+        """
+        processed_date = datetime.now()
+
+        if np is None:
+            batch = [PayrollData(employee, pay_period, processed_date) for employee in employees]
+            self._record(batch)
+            return batch
+
+        fulltime_idx = []
+        contract_idx = []
+        other_idx = []
+        for i, employee in enumerate(employees):
+            if type(employee) is FulltimeEmployee and type(employee.tax_calculator) is FulltimeTax:
+                fulltime_idx.append(i)
+            elif type(employee) is ContractEmployee and type(employee.tax_calculator) is ContractTax:
+                contract_idx.append(i)
+            else:
+                other_idx.append(i)
+
+        gross = np.empty(len(employees), dtype=np.float64)
+        deductions = np.empty(len(employees), dtype=np.float64)
+        net = np.empty(len(employees), dtype=np.float64)
+
+        if fulltime_idx:
+            gross[fulltime_idx], deductions[fulltime_idx], net[fulltime_idx] = self._batch_fulltime(
+                [employees[i] for i in fulltime_idx]
+            )
+        if contract_idx:
+            gross[contract_idx], deductions[contract_idx], net[contract_idx] = self._batch_contract(
+                [employees[i] for i in contract_idx]
+            )
+        for i in other_idx:
+            gross[i] = employees[i].calculate_gross()
+            deductions[i] = employees[i]._calculate_deduction_from_gross(gross[i])
+            net[i] = gross[i] - deductions[i]
+
+        # Write back to PayrollData objects for API compatibility
+        batch = [
+            PayrollData._from_values(employee, pay_period, processed_date, g, d, n)
+            for employee, g, d, n in zip(employees, gross.tolist(), deductions.tolist(), net.tolist())
+        ]
+        self._record(batch, gross, net)
+        return batch
+
+    @staticmethod
+    def _periode_codes(employees: List[Employee]):
+        return np.array(
+            [e.periode_tunjangan for e in employees],
+            dtype=np.int8,
+        )
+
+    @staticmethod
+    def _batch_fulltime(employees: List["FulltimeEmployee"]):
+        base_salary = np.array([e.base_salary for e in employees], dtype=np.float64)
+        work_hour = np.array([e.work_hour for e in employees], dtype=np.float64)
+        tunjangan = np.array([e.tunjangan for e in employees], dtype=np.float64)
+        periode_code = Payroll._periode_codes(employees)
+
+        kernels = _load_kernels()
+        if kernels.HAS_COMPILED_KERNELS:
+            gross = np.empty_like(base_salary)
+            deductions = np.empty_like(base_salary)
+            net = np.empty_like(base_salary)
+            kernels.fulltime_kernel(base_salary, work_hour, tunjangan, periode_code, gross, deductions, net)
+            return gross, deductions, net
+
+        overtime_pay = np.maximum(0, work_hour - 173) * (base_salary / 173) * 1.5
+        monthly_tunjangan = tunjangan / np.array(FulltimeEmployee._TUNJANGAN_DIVISORS)[periode_code]
+        gross = base_salary + overtime_pay + monthly_tunjangan
+
+        tax = FulltimeTax().calculate_tax_vec(gross * 12) / 12
+        deductions = tax + gross * 0.03
+        return gross, deductions, gross - deductions
+
+    @staticmethod
+    def _batch_contract(employees: List["ContractEmployee"]):
+        work_hour = np.array([e.work_hour for e in employees], dtype=np.float64)
+        hourly_rate = np.array([e.hourly_rate for e in employees], dtype=np.float64)
+        tunjangan = np.array([e.tunjangan for e in employees], dtype=np.float64)
+        periode_code = Payroll._periode_codes(employees)
+
+        kernels = _load_kernels()
+        if kernels.HAS_COMPILED_KERNELS:
+            gross = np.empty_like(work_hour)
+            deductions = np.empty_like(work_hour)
+            net = np.empty_like(work_hour)
+            kernels.contract_kernel(work_hour, hourly_rate, tunjangan, periode_code, gross, deductions, net)
+            return gross, deductions, net
+
+        monthly_tunjangan = tunjangan / np.array(ContractEmployee._TUNJANGAN_DIVISORS)[periode_code]
+        gross = work_hour * hourly_rate + monthly_tunjangan
+        deductions = gross * 0.025
+        return gross, deductions, gross - deductions
     
+    def totals(self) -> Tuple[float, float]:
+        """
+        Total gross and net salary over all processed records.
+
+        Batch columns are reduced with NumPy instead of re-walking the records.
+
+        Returns:
+            Tuple[float, float]: Total gross salary and total net salary
+        """
+        total_gross = self._scalar_gross
+        total_net = self._scalar_net
+        for gross, net in zip(self._batch_gross, self._batch_net):
+            total_gross += float(gross.sum())
+            total_net += float(net.sum())
+        return total_gross, total_net
+
+    @property
+    def payroll_records(self) -> List[PayrollData]:
+        """All processed records (read-only; see ``get_payroll_records``)."""
+        return self._records
+
     def get_payroll_records(self) -> List[PayrollData]:
-        return self.payroll_records
+        """
+        Return all processed records.
+
+        The returned list is the payroll's own storage, not a copy; do not
+        modify it, or get_employee_payroll and totals() go out of sync.
+
+        Returns:
+            List[PayrollData]: The records, in processing order
+        """
+        return self._records
     
     def get_employee_payroll(self, employee_id: str) -> List[PayrollData]:
-        return [record for record in self.payroll_records if record.employee.employee_id == employee_id]
+        return list(self._by_emp.get(employee_id, ()))
+
+
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 class PayrollPresentation:
+    @staticmethod
+    def format_payroll_summary(payroll_data: PayrollData, processed_date_str: Optional[str] = None) -> str:
+        if processed_date_str is None:
+            processed_date_str = payroll_data.processed_date.strftime(_DATE_FORMAT)
+        employee = payroll_data.employee
+        return (
+            f"=== Payroll Summary ===\n"
+            f"Employee ID: {employee.employee_id}\n"
+            f"Employee Type: {employee.EMPLOYEE_TYPE_LABEL}\n"
+            f"Pay Period: {payroll_data.pay_period}\n"
+            f"Processed Date: {processed_date_str}\n"
+            f"Work Hours: {employee.work_hour}\n"
+            f"Gross Salary: Rp {payroll_data.gross_salary:,.2f}\n"
+            f"Deductions: Rp {payroll_data.deductions:,.2f}\n"
+            f"Net Salary: Rp {payroll_data.net_salary:,.2f}\n"
+            + "-" * 40
+        )
+
     @staticmethod
     def print_payroll_summary(payroll_data: PayrollData):
-        print(f"=== Payroll Summary ===")
-        print(f"Employee ID: {payroll_data.employee.employee_id}")
-        print(f"Employee Type: {type(payroll_data.employee).__name__}")
-        print(f"Pay Period: {payroll_data.pay_period}")
-        print(f"Processed Date: {payroll_data.processed_date.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Work Hours: {payroll_data.employee.work_hour}")
-        print(f"Gross Salary: Rp {payroll_data.gross_salary:,.2f}")
-        print(f"Deductions: Rp {payroll_data.deductions:,.2f}")
-        print(f"Net Salary: Rp {payroll_data.net_salary:,.2f}")
-        print("-" * 40)
-    
+        print(PayrollPresentation.format_payroll_summary(payroll_data))
+
     @staticmethod
-    def print_all_payrolls(payroll_records: List[PayrollData]):
-        print("=== ALL PAYROLL RECORDS ===\n")
-        total_gross = 0
-        total_net = 0
-        
+    def format_all_payrolls(payroll_records: List[PayrollData],
+                            totals: Optional[Tuple[float, float]] = None) -> str:
+        if totals is not None:
+            total_gross, total_net = totals
+        else:
+            total_gross = sum(record.gross_salary for record in payroll_records)
+            total_net = sum(record.net_salary for record in payroll_records)
+
+        # Records from one batch share a processed date, so format each date once
+        date_strs = {}
+        parts = ["=== ALL PAYROLL RECORDS ===\n\n"]
         for record in payroll_records:
-            PayrollPresentation.print_payroll_summary(record)
-            total_gross += record.gross_salary
-            total_net += record.net_salary
-            print()
-        
-        print(f"=== TOTAL SUMMARY ===")
-        print(f"Total Employees: {len(payroll_records)}")
-        print(f"Total Gross Payroll: Rp {total_gross:,.2f}")
-        print(f"Total Net Payroll: Rp {total_net:,.2f}")
-        print(f"Total Deductions: Rp {total_gross - total_net:,.2f}")
+            date_str = date_strs.get(record.processed_date)
+            if date_str is None:
+                date_str = date_strs[record.processed_date] = record.processed_date.strftime(_DATE_FORMAT)
+            parts.append(PayrollPresentation.format_payroll_summary(record, date_str) + "\n\n")
+        parts.append(
+            f"=== TOTAL SUMMARY ===\n"
+            f"Total Employees: {len(payroll_records)}\n"
+            f"Total Gross Payroll: Rp {total_gross:,.2f}\n"
+            f"Total Net Payroll: Rp {total_net:,.2f}\n"
+            f"Total Deductions: Rp {total_gross - total_net:,.2f}\n"
+        )
+        return "".join(parts)
+
+    @staticmethod
+    def print_all_payrolls(payroll_records: List[PayrollData],
+                           totals: Optional[Tuple[float, float]] = None):
+        # One write for the whole report instead of several print() calls per record
+        sys.stdout.write(PayrollPresentation.format_all_payrolls(payroll_records, totals))
 
 
 if __name__ == "__main__":
@@ -301,8 +611,23 @@ if __name__ == "__main__":
     print()
     
     # Display all payrolls with total summary
-    presentation.print_all_payrolls(payroll.get_payroll_records())
-    
+    presentation.print_all_payrolls(payroll.get_payroll_records(), payroll.totals())
+
+    # Process the same employees as one batch and compare with the results above
+    print("\n=== Batch Processing ===")
+    batch_payroll = Payroll()
+    batch_records = batch_payroll.process_batch([fulltime_emp, contract_emp, contract_emp2], "September 2024")
+    for scalar, batched in zip([ft_payroll, ct_payroll, ct2_payroll], batch_records):
+        matches = all(
+            math.isclose(a, b, rel_tol=1e-12)
+            for a, b in (
+                (scalar.gross_salary, batched.gross_salary),
+                (scalar.deductions, batched.deductions),
+                (scalar.net_salary, batched.net_salary),
+            )
+        )
+        print(f"{batched.employee.employee_id}: Net Salary Rp {batched.net_salary:,.2f} (matches per-employee result: {matches})")
+
     print("\n=== System supports extensibility for new employee types ===")
     print("To add new employee types, simply:")
     print("1. Create a new Tax class inheriting from Tax")
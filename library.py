@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 
 class LibraryError(Exception):
@@ -25,12 +25,28 @@ class BookNotBorrowedError(LibraryError):
     """Raised when trying to return a book that is not currently borrowed."""
 
 
+class BulkBorrowError(LibraryError):
+    """
+    Raised when some entries of a bulk borrow could not be processed.
+
+    Attributes:
+    - failures: (id_anggota, id_buku, reason) for every rejected entry
+    """
+
+    def __init__(self, failures: List[Tuple[str, str, str]]) -> None:
+        self.failures = failures
+        detail = "; ".join(
+            f"{id_anggota}/{id_buku}: {reason}" for id_anggota, id_buku, reason in failures
+        )
+        super().__init__(f"{len(failures)} peminjaman gagal: {detail}")
+
+
 class BookStatus(Enum):
     AVAILABLE = "available"
     BORROWED = "borrowed"
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class Buku:
     """
     Book entity.
@@ -39,22 +55,55 @@ class Buku:
     - id_buku: unique identifier of the book in the library
     - judul: book title
     - penulis: author name
-    - status: availability status (AVAILABLE | BORROWED)
+    - available: True if the book can be borrowed
     - dipinjam_oleh: member id currently borrowing the book (if any)
+
+    The ``status`` property exposes availability as a BookStatus. The
+    constructor still accepts ``status`` (positionally or by keyword, as
+    before) and, alternatively, ``available`` by keyword; ``status`` wins
+    when both are given, so ``dataclasses.replace(b, status=...)`` works.
     """
 
     id_buku: str
     judul: str
     penulis: str
-    status: BookStatus = BookStatus.AVAILABLE
-    dipinjam_oleh: Optional[str] = None
+    available: bool
+    dipinjam_oleh: Optional[str]
+
+    def __init__(
+        self,
+        id_buku: str,
+        judul: str,
+        penulis: str,
+        status: Optional[BookStatus] = None,
+        dipinjam_oleh: Optional[str] = None,
+        *,
+        available: Optional[bool] = None,
+    ) -> None:
+        self.id_buku = id_buku
+        self.judul = judul
+        self.penulis = penulis
+        if status is not None:
+            self.available = status is BookStatus.AVAILABLE
+        else:
+            self.available = True if available is None else available
+        self.dipinjam_oleh = dipinjam_oleh
+
+    @property
+    def status(self) -> BookStatus:
+        """Availability status (AVAILABLE | BORROWED)."""
+        return BookStatus.AVAILABLE if self.available else BookStatus.BORROWED
+
+    @status.setter
+    def status(self, value: BookStatus) -> None:
+        self.available = value is BookStatus.AVAILABLE
 
     def tersedia(self) -> bool:
         """Return True if this book is available to borrow."""
-        return self.status is BookStatus.AVAILABLE
+        return self.available
 
 
-@dataclass
+@dataclass(slots=True)
 class Anggota:
     """
     Member entity.
@@ -62,12 +111,16 @@ class Anggota:
     Attributes:
     - idAnggota: unique identifier for the member
     - nama: member name
-    - buku_dipinjam: list of book ids currently borrowed by this member
+    - buku_dipinjam: set of book ids currently borrowed by this member
     """
 
     idAnggota: str
     nama: str
-    buku_dipinjam: List[str] = field(default_factory=list)
+    buku_dipinjam: Set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of book ids (e.g. the list used previously)
+        self.buku_dipinjam = set(self.buku_dipinjam)
 
     # Per requirement, methods live on the Anggota class
     def pinjamBuku(self, perpustakaan: "Perpustakaan", id_buku: str) -> None:
@@ -81,7 +134,7 @@ class Anggota:
         Postconditions:
         - Buku.status == BORROWED
         - Buku.dipinjam_oleh == self.idAnggota
-        - id_buku is appended to self.buku_dipinjam
+        - id_buku is added to self.buku_dipinjam
         """
         perpustakaan.pinjam_buku(self.idAnggota, id_buku)
 
@@ -123,6 +176,10 @@ class Perpustakaan:
     def tambah_anggota(self, anggota: Anggota) -> None:
         self._anggota[anggota.idAnggota] = anggota
 
+    def daftar_buku_tersedia(self) -> List[Buku]:
+        """Return all books that are currently available to borrow."""
+        return [b for b in self._buku.values() if b.available]
+
     def cari_buku(self, id_buku: str) -> Buku:
         buku = self._buku.get(id_buku)
         if buku is None:
@@ -148,7 +205,7 @@ class Perpustakaan:
 
         Postconditions:
         - Buku.status == BORROWED and dipinjam_oleh == id_anggota
-        - id_buku is added to the member's buku_dipinjam list
+        - id_buku is added to the member's buku_dipinjam set
         """
         anggota = self.cari_anggota(id_anggota)
         buku = self.cari_buku(id_buku)
@@ -159,15 +216,47 @@ class Perpustakaan:
             )
 
         # Centralized state mutation in Perpustakaan to keep consistency
-        buku.status = BookStatus.BORROWED
+        buku.available = False
         buku.dipinjam_oleh = anggota.idAnggota
-        if id_buku not in anggota.buku_dipinjam:
-            anggota.buku_dipinjam.append(id_buku)
+        anggota.buku_dipinjam.add(id_buku)
+
+    def pinjam_buku_bulk(self, pairs: List[Tuple[str, str]]) -> None:
+        """
+        Borrow many books in one call.
 
-        # Postconditions (defensive checks - can be removed if unnecessary)
-        assert not buku.tersedia()
-        assert buku.dipinjam_oleh == anggota.idAnggota
-        assert id_buku in anggota.buku_dipinjam
+        Each pair is (id_anggota, id_buku). Valid entries are applied exactly
+        like pinjam_buku; invalid ones (unknown member or book, or a book that
+        is not available) are skipped and reported together afterwards.
+
+        Raises:
+        - BulkBorrowError: if at least one entry was rejected
+        """
+        # Local aliases keep the loop free of repeated attribute lookups
+        aget = self._anggota.__getitem__
+        bget = self._buku.__getitem__
+        failures: List[Tuple[str, str, str]] = []
+
+        for id_anggota, id_buku in pairs:
+            try:
+                anggota = aget(id_anggota)
+            except KeyError:
+                failures.append((id_anggota, id_buku, "anggota tidak ditemukan"))
+                continue
+            try:
+                buku = bget(id_buku)
+            except KeyError:
+                failures.append((id_anggota, id_buku, "buku tidak ditemukan"))
+                continue
+            if not buku.available:
+                failures.append((id_anggota, id_buku, "buku tidak tersedia"))
+                continue
+
+            buku.available = False
+            buku.dipinjam_oleh = id_anggota
+            anggota.buku_dipinjam.add(id_buku)
+
+        if failures:
+            raise BulkBorrowError(failures)
 
     def kembalikan_buku(self, id_anggota: str, id_buku: str) -> None:
         """
@@ -179,26 +268,20 @@ class Perpustakaan:
 
         Postconditions:
         - Buku.status == AVAILABLE and dipinjam_oleh == None
-        - id_buku is removed from the member's buku_dipinjam list
+        - id_buku is removed from the member's buku_dipinjam set
         """
         anggota = self.cari_anggota(id_anggota)
         buku = self.cari_buku(id_buku)
 
-        if buku.status is not BookStatus.BORROWED or buku.dipinjam_oleh != id_anggota:
+        if buku.available or buku.dipinjam_oleh != id_anggota:
             raise BukuTidakSedangDipinjamError(
                 f"Buku '{buku.judul}' tidak sedang dipinjam oleh anggota ini"
             )
 
         # State mutation
-        buku.status = BookStatus.AVAILABLE
+        buku.available = True
         buku.dipinjam_oleh = None
-        if id_buku in anggota.buku_dipinjam:
-            anggota.buku_dipinjam.remove(id_buku)
-
-        # Postconditions
-        assert buku.tersedia()
-        assert buku.dipinjam_oleh is None
-        assert id_buku not in anggota.buku_dipinjam
+        anggota.buku_dipinjam.discard(id_buku)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+"""
+Tests for Payroll.process_batch.
+
+Every batch path (compiled kernels, NumPy columns, no NumPy) must give the
+same results as building PayrollData one employee at a time.
+
+Run with:
+
+    python -m unittest test_employee
+"""
+
+import math
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import employee
+from employee import (
+    ContractEmployee,
+    ContractTax,
+    FulltimeEmployee,
+    FulltimeTax,
+    Payroll,
+    PayrollData,
+    Periode,
+)
+from _payroll_tables import FULLTIME_BRACKETS
+
+
+class FlatFulltimeTax(FulltimeTax):
+    """Custom tax strategy; employees using it take the scalar path."""
+    _BRACKETS = (1e6, 2e6, 3e6)
+
+
+class ProjectEmployee(ContractEmployee):
+    """Custom employee type; it takes the scalar path."""
+
+
+def _employees():
+    employees = []
+    for periode in list(Periode) + ["monthly", "yearly", "per_project", "unknown"]:
+        employees.append(FulltimeEmployee(f"FT-{periode}", 180, 1200000, periode, 8000000, FulltimeTax()))
+        employees.append(ContractEmployee(f"CT-{periode}", 120, 1200000, periode, 75000, ContractTax()))
+
+    # Annual gross exactly on, and just above, every bracket bound
+    for bound in FULLTIME_BRACKETS:
+        employees.append(FulltimeEmployee(f"FT-on-{bound}", 173, 0, Periode.NONE, bound / 12, FulltimeTax()))
+        employees.append(FulltimeEmployee(f"FT-above-{bound}", 173, 0, Periode.NONE, (bound + 12) / 12, FulltimeTax()))
+    employees.append(FulltimeEmployee("FT-top", 200, 0, Periode.NONE, 60000000, FulltimeTax()))
+
+    employees.append(FulltimeEmployee("FT-custom-tax", 180, 500000, "yearly", 8000000, FlatFulltimeTax()))
+    employees.append(ProjectEmployee("PR-001", 100, 1000000, "per_project", 60000, ContractTax()))
+    return employees
+
+
+class _BatchMatchesScalar:
+    def assert_batch_matches_scalar(self):
+        employees = _employees()
+        payroll = Payroll()
+        batch = payroll.process_batch(employees, "September 2024")
+
+        self.assertEqual(len(batch), len(employees))
+        now = datetime.now()
+        for emp, record in zip(employees, batch):
+            expected = PayrollData(emp, "September 2024", now)
+            self.assertIs(record.employee, emp)
+            for field in ("gross_salary", "deductions", "net_salary"):
+                actual = getattr(record, field)
+                wanted = getattr(expected, field)
+                self.assertTrue(
+                    math.isclose(actual, wanted, rel_tol=1e-12),
+                    f"{emp.employee_id} {field}: {actual} != {wanted}",
+                )
+
+        total_gross, total_net = payroll.totals()
+        self.assertTrue(math.isclose(total_gross, sum(r.gross_salary for r in batch), rel_tol=1e-12))
+        self.assertTrue(math.isclose(total_net, sum(r.net_salary for r in batch), rel_tol=1e-12))
+        self.assertEqual(payroll.get_employee_payroll("PR-001"), [batch[-1]])
+
+
+@unittest.skipIf(employee.np is None, "NumPy is not installed")
+class CompiledKernelBatchTest(_BatchMatchesScalar, unittest.TestCase):
+    def test_batch_matches_scalar(self):
+        if not employee._load_kernels().HAS_COMPILED_KERNELS:
+            self.skipTest("Numba is not installed and no AOT kernels were built")
+        self.assert_batch_matches_scalar()
+
+
+@unittest.skipIf(employee.np is None, "NumPy is not installed")
+class NumPyBatchTest(_BatchMatchesScalar, unittest.TestCase):
+    def test_batch_matches_scalar(self):
+        with mock.patch.object(employee._load_kernels(), "HAS_COMPILED_KERNELS", False):
+            self.assert_batch_matches_scalar()
+
+
+class NoNumPyBatchTest(_BatchMatchesScalar, unittest.TestCase):
+    def test_batch_matches_scalar(self):
+        with mock.patch.object(employee, "np", None):
+            self.assert_batch_matches_scalar()
+
+
+if __name__ == "__main__":
+    unittest.main()